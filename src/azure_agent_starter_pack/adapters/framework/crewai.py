@@ -30,4 +30,5 @@ class CrewAiAdapter(FrameworkAdapter):
             "crew_tasks": True,
             "crew_tools": True,
             "azure_openai_config": True,
+            "streaming_support": True,
         }
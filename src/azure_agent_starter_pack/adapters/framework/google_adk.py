@@ -30,4 +30,5 @@ class GoogleAdkAdapter(FrameworkAdapter):
             "adk_tools": True,
             "adk_sessions": True,
             "azure_openai_config": True,
+            "streaming_support": True,
         }
@@ -32,4 +32,5 @@ class MicrosoftAgentFrameworkAdapter(FrameworkAdapter):
             "azure_monitor_hooks": True,
             "agent_composition": True,
             "memory_tool_orchestration": True,
+            "streaming_support": True,
         }
@@ -25,6 +25,15 @@ class AksAdapter(RuntimeAdapter):
             "helm_charts": True,
             "kustomize": True,
             "hpa": True,
+            # KEDA can scale on in-flight requests as well as CPU and memory
+            # (an agent waiting on the LLM queues requests while the CPU
+            # idles). It is generated as an opt-in: its trigger needs a
+            # Prometheus that the project does not provision, so the CPU HPA
+            # stays the default.
+            "keda": True,
+            "min_replicas": 2,
+            "max_replicas": 10,
+            "concurrent_requests_per_replica": 10,
             "managed_identity_binding": True,
             "azure_monitor_integration": True,
         }
@@ -25,5 +25,15 @@ class AppServiceAdapter(RuntimeAdapter):
             "managed_identity_binding": True,
             "app_settings": True,
             "deployment_slots": True,
+            # App Service autoscale has no concurrency rule; the plan's HTTP
+            # queue length (requests waiting for a worker) is the closest signal.
+            "autoscale": True,
+            "min_replicas": 1,
+            "max_replicas": 5,
+            "http_queue_length_per_instance": 10,
+            # Keep the app loaded when idle, and warm new instances (scale-out,
+            # restarts) on this path before they join the load balancer.
+            "always_on": True,
+            "warmup_path": "/ready",
             "azure_monitor_integration": True,
         }
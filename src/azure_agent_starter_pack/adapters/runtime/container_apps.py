@@ -25,5 +25,12 @@ class ContainerAppsAdapter(RuntimeAdapter):
             "dapr": True,
             "managed_identity_binding": True,
             "revision_management": True,
+            # Replicas kept running through lulls (0 allows scale to zero,
+            # which makes the next request wait for a cold start).
+            "min_replicas": 1,
+            "max_replicas": 10,
+            "concurrent_requests_per_replica": 10,
+            # Startup probe path: a replica counts as started once warm.
+            "warmup_path": "/ready",
             "azure_monitor_integration": True,
         }
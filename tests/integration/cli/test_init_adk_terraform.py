@@ -55,7 +55,7 @@ def test_dockerfile_present(tmp_path: Path) -> None:
     target = _scaffold_adk(tmp_path)
     dockerfile = (target / "Dockerfile").read_text()
     assert "requirements.txt" in dockerfile
-    assert "uvicorn" in dockerfile
+    assert "gunicorn.conf.py" in dockerfile
 
 
 def test_env_example_present(tmp_path: Path) -> None:
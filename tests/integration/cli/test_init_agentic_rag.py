@@ -46,6 +46,11 @@ def test_rag_requirements_present(tmp_path: Path, framework: str) -> None:
     content = rag_reqs.read_text()
     assert "azure-search-documents" in content
     assert "langchain" in content
+    ingest = (target / "requirements-ingest.txt").read_text()
+    assert "-r requirements-rag.txt" in ingest
+    assert "pypdf" in ingest
+    dockerfile = (target / "Dockerfile").read_text()
+    assert "uv pip install -r requirements-rag.txt" in dockerfile
 
 
 @pytest.mark.parametrize("framework", FRAMEWORKS)
@@ -63,6 +68,88 @@ def test_indexing_script_present(tmp_path: Path, framework: str) -> None:
     assert "ensure_index" in content
 
 
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_streaming_ingest_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    ingest = (target / "app" / "rag" / "ingest.py").read_text()
+    assert "run_pipeline" in ingest
+    assert "queue.Queue(maxsize=" in ingest
+    script = (target / "scripts" / "index_documents.py").read_text()
+    assert "run_pipeline" in script
+    assert "--ledger" in script
+    assert (target / "app" / "rag" / "ledger.py").is_file()
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_token_chunker_and_benchmark_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    chunker = (target / "app" / "rag" / "chunker.py").read_text()
+    assert "def chunk_file" in chunker
+    assert "mmap" in chunker
+    assert (target / "scripts" / "benchmark_chunker.py").is_file()
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_compact_command_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    script = (target / "scripts" / "compact_index.py").read_text()
+    assert "compact(" in script
+    indexer = (target / "app" / "rag" / "indexer.py").read_text()
+    assert "def delete_documents" in indexer
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_local_retriever_backend_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    assert (target / "app" / "rag" / "local_index.py").is_file()
+    retriever = (target / "app" / "rag" / "retriever.py").read_text()
+    assert "RETRIEVER_BACKEND" in retriever
+    assert "numpy" in (target / "requirements-rag.txt").read_text()
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_context_packing_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    context = (target / "app" / "rag" / "context.py").read_text()
+    assert "def assemble_context" in context
+    assert "assemble_context" in (target / "app" / "tools" / "retrieval_tool.py").read_text()
+    assert "tiktoken" in (target / "requirements-rag.txt").read_text()
+    assert "CONTEXT_TOKEN_BUDGET" in (target / ".env.example").read_text()
+    assert "asyncio.to_thread(retrieve" in (target / "app" / "main.py").read_text()
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_vector_compression_options_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    indexer = (target / "app" / "rag" / "indexer.py").read_text()
+    assert "vector_search_dimensions=EMBEDDING_DIMENSIONS" in indexer
+    assert "BinaryQuantizationCompression" in indexer and "ScalarQuantizationCompression" in indexer
+    assert "dimensions=embedding_dimensions()" in (target / "app" / "rag" / "embedder.py").read_text()
+    assert (target / "scripts" / "benchmark_vectors.py").is_file()
+    assert "VECTOR_COMPRESSION" in (target / ".env.example").read_text()
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_metadata_filters_present(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    rag_dir = target / "app" / "rag"
+    assert "METADATA_FIELDS" in (rag_dir / "config.py").read_text()
+    assert "filterable=True, facetable=True" in (rag_dir / "indexer.py").read_text()
+    retriever = (rag_dir / "retriever.py").read_text()
+    assert "filter: str | None = None" in retriever
+    assert "VectorFilterMode.PRE_FILTER" in retriever
+    assert 'filter=query.get("filter")' in (target / "app" / "main.py").read_text()
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_rag_clients_use_shared_token_provider(tmp_path: Path, framework: str) -> None:
+    target = _scaffold_rag(tmp_path, framework)
+    rag_dir = target / "app" / "rag"
+    assert "openai_auth_kwargs" in (rag_dir / "embedder.py").read_text()
+    for f in ["embedder.py", "indexer.py", "retriever.py"]:
+        assert "DefaultAzureCredential" not in (rag_dir / f).read_text(), f
+
+
 @pytest.mark.parametrize("framework", FRAMEWORKS)
 def test_retrieval_tool_present(tmp_path: Path, framework: str) -> None:
     target = _scaffold_rag(tmp_path, framework)
@@ -78,6 +165,7 @@ def test_rag_main_has_search_endpoint(tmp_path: Path, framework: str) -> None:
     main = (target / "app" / "main.py").read_text()
     assert "/search" in main
     assert "Agentic RAG" in main
+    assert '"/run/stream"' in main
 
 
 @pytest.mark.parametrize("framework", FRAMEWORKS)
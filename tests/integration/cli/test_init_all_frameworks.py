@@ -8,7 +8,7 @@ import pytest
 
 FRAMEWORKS = [
     ("google_adk", "root_agent.py", "google.adk"),
-    ("microsoft_agent_framework", "orchestrator.py", "azure.ai.projects"),
+    ("microsoft_agent_framework", "registry.py", "azure.ai.projects"),
     ("langgraph", "graph.py", "langgraph"),
     ("crewai", "crew.py", "crewai"),
 ]
@@ -72,6 +72,133 @@ def test_framework_has_agent_tests(tmp_path: Path, framework: str, main_agent_fi
     assert (target / "tests" / "test_agents.py").is_file()
 
 
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_has_streaming_endpoint(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    main = (target / "app" / "main.py").read_text()
+    assert '"/run/stream"' in main
+    assert "sse_response" in main
+    assert (target / "app" / "streaming.py").is_file()
+    assert (target / "tests" / "test_streaming.py").is_file()
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_uses_shared_identity_layer(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    identity = (target / "src" / "identity.py").read_text()
+    assert "class TokenProvider" in identity
+    assert "class SecretCache" in identity
+    assert "preload_secrets()" in (target / "app" / "main.py").read_text()
+    assert "class AdaptiveLimiter" in (target / "src" / "limiter.py").read_text()
+    assert "src.limiter import" in "".join(p.read_text() for p in (target / "app").rglob("*.py"))
+    assert (target / "tests" / "test_identity.py").is_file()
+    for path in (target / "app").rglob("*.py"):
+        assert ".get_token(" not in path.read_text(), path
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_has_batch_endpoint(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    assert '"/run/batch"' in (target / "app" / "main.py").read_text()
+    assert (target / "app" / "batch.py").is_file()
+    assert (target / "tests" / "test_batch.py").is_file()
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_serves_telemetry(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    main = (target / "app" / "main.py").read_text()
+    assert "setup_telemetry()" in main
+    assert "instrument_app(app)" in main
+    assert "opentelemetry-exporter-prometheus" in (target / "requirements.txt").read_text()
+    assert "def instrument_app" in (target / "src" / "observability.py").read_text()
+    assert (target / "tests" / "test_observability.py").is_file()
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_ships_offline_loadtest(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    scripts = target / "scripts"
+    assert "def run_load" in (scripts / "loadtest.py").read_text()
+    assert "--throttle-rate" in (scripts / "azure_stubs.py").read_text()
+    assert (target / "tests" / "test_loadtest.py").is_file()
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_serves_with_preforked_workers(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    assert 'CMD ["gunicorn", "app.main:app", "--config", "gunicorn.conf.py"]' in (target / "Dockerfile").read_text()
+    config = (target / "gunicorn.conf.py").read_text()
+    assert "preload_app = True" in config
+    assert "uvicorn_worker.UvicornWorker" in config
+    assert "def worker_count" in (target / "src" / "server.py").read_text()
+    assert '"--reload"' in (target / "run.py").read_text()
+    assert "reload=True" not in (target / "app" / "main.py").read_text()
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_builds_slim_image(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    dockerfile = (target / "Dockerfile").read_text()
+    assert "AS builder" in dockerfile
+    assert "uv pip install -r requirements.txt" in dockerfile
+    assert "compileall" in dockerfile
+    assert "COPY . ." not in dockerfile
+    ignored = (target / ".dockerignore").read_text().splitlines()
+    assert "tests/" in ignored and ".env" in ignored
+    assert "def largest_layers" in (target / "scripts" / "image_report.py").read_text()
+
+
+@pytest.mark.parametrize("framework,main_agent_file,import_marker", FRAMEWORKS)
+def test_framework_warms_up_behind_readiness_probe(tmp_path: Path, framework: str, main_agent_file: str, import_marker: str) -> None:
+    target = _scaffold(tmp_path, framework)
+    main = (target / "app" / "main.py").read_text()
+    assert '@app.get("/ready")' in main
+    assert "readiness.start(_warmup_steps)" in main
+    assert "class Readiness" in (target / "app" / "readiness.py").read_text()
+
+
+def test_langgraph_compiles_graph_once(tmp_path: Path) -> None:
+    target = _scaffold(tmp_path, "langgraph")
+    graph = (target / "app" / "agents" / "graph.py").read_text()
+    assert "def get_graph" in graph
+    assert "await _get_agent_llm().ainvoke" in graph
+    main = (target / "app" / "main.py").read_text()
+    assert "build_graph()" not in main
+    assert "lifespan=lifespan" in main
+    assert (target / "scripts" / "benchmark_graph.py").is_file()
+
+
+def test_microsoft_reuses_agents_and_client(tmp_path: Path) -> None:
+    target = _scaffold(tmp_path, "microsoft_agent_framework")
+    orchestrator = (target / "app" / "agents" / "orchestrator.py").read_text()
+    assert "get_agent_id" in orchestrator
+    assert "create_agent" not in orchestrator
+    registry = (target / "app" / "agents" / "registry.py").read_text()
+    assert "azure.ai.projects.aio" in registry
+    assert "conversation_id" in (target / "app" / "main.py").read_text()
+
+
+def test_crewai_runs_kickoffs_off_the_event_loop(tmp_path: Path) -> None:
+    target = _scaffold(tmp_path, "crewai")
+    main = (target / "app" / "main.py").read_text()
+    assert "get_crew_pool().kickoff(" in main
+    assert "crew.kickoff(" not in main
+    assert "CrewPoolFull" in main
+    assert (target / "app" / "agents" / "crew_pool.py").is_file()
+
+
+def test_google_adk_reuses_runner_and_sessions(tmp_path: Path) -> None:
+    target = _scaffold(tmp_path, "google_adk")
+    main = (target / "app" / "main.py").read_text()
+    assert "InMemorySessionService()" not in main
+    assert "get_or_create_session" in main
+    sessions = (target / "app" / "sessions.py").read_text()
+    assert "LRUSessionService" in sessions
+    assert "DatabaseSessionService" in sessions
+    assert "SESSION_BACKEND" in (target / ".env.example").read_text()
+
+
 def test_aks_kubernetes_manifests(tmp_path: Path) -> None:
     target = _scaffold(tmp_path, "google_adk")
     k8s = target / "k8s"
@@ -87,7 +214,9 @@ def test_aks_deployment_has_health_probes(tmp_path: Path) -> None:
     deployment = (target / "k8s" / "deployment.yaml").read_text()
     assert "livenessProbe" in deployment
     assert "readinessProbe" in deployment
+    assert "startupProbe" in deployment
     assert "/health" in deployment
+    assert "path: /ready" in deployment
 
 
 def test_aks_hpa_configured(tmp_path: Path) -> None:
@@ -95,3 +224,66 @@ def test_aks_hpa_configured(tmp_path: Path) -> None:
     hpa = (target / "k8s" / "hpa.yaml").read_text()
     assert "HorizontalPodAutoscaler" in hpa
     assert "minReplicas" in hpa
+
+
+def test_aks_keda_scaling_is_opt_in(tmp_path: Path) -> None:
+    target = _scaffold(tmp_path, "langgraph")
+    scaled = (target / "k8s" / "scaledobject.yaml").read_text()
+    assert "kind: ScaledObject" in scaled
+    assert "http_server_active_requests" in scaled
+    kustomization = (target / "k8s" / "kustomization.yaml").read_text()
+    assert "- hpa.yaml" in kustomization
+    assert "- scaledobject.yaml" not in kustomization
+    assert "keda_enabled = var.enable_keda" in (target / "infra" / "main.tf").read_text()
+    assert 'variable "enable_keda"' in (target / "infra" / "variables.tf").read_text()
+    assert "http.server.active_requests" in (target / "src" / "observability.py").read_text()
+
+
+@pytest.mark.parametrize("runtime,iac,markers", [
+    ("container_apps", "terraform", ["http_scale_rule", "min_replicas = 1", 'path                    = "/ready"', 'path                    = "/health"']),
+    ("container_apps", "bicep", ["concurrentRequests", "minReplicas: 1", "type: 'Startup', httpGet: { path: '/health'", "type: 'Readiness', httpGet: { path: '/ready'"]),
+    ("app_service", "terraform", ["HttpQueueLength", "always_on = true", "WEBSITE_WARMUP_PATH"]),
+    ("app_service", "bicep", ["HttpQueueLength", "alwaysOn: true", "WEBSITE_WARMUP_PATH"]),
+])
+def test_paas_runtimes_scale_on_requests_from_a_warm_pool(tmp_path: Path, runtime: str, iac: str, markers: list[str]) -> None:
+    target = tmp_path / f"{runtime}_{iac}"
+    target.mkdir()
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "azure_agent_starter_pack.cli.app",
+            "init", str(target),
+            "--framework", "langgraph",
+            "--project-type", "multi_agent_api",
+            "--pipeline", "github_actions",
+            "--runtime", runtime,
+            "--iac", iac,
+            "--non-interactive",
+        ],
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    main = (target / "infra" / ("main.tf" if iac == "terraform" else "main.bicep")).read_text()
+    for marker in markers:
+        assert marker in main
+
+
+def test_react_ui_streams_responses(tmp_path: Path) -> None:
+    target = tmp_path / "react_ui"
+    target.mkdir()
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "azure_agent_starter_pack.cli.app",
+            "init", str(target),
+            "--framework", "langgraph",
+            "--project-type", "multi_agent_react_ui",
+            "--pipeline", "github_actions",
+            "--runtime", "aks",
+            "--iac", "terraform",
+            "--non-interactive",
+        ],
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    app_jsx = (target / "frontend" / "src" / "App.jsx").read_text()
+    assert "/run/stream" in app_jsx
+    assert "getReader()" in app_jsx
@@ -23,4 +23,5 @@ def test_context_contains_azure_keys() -> None:
     assert ctx["managed_identity"] is True
     assert ctx["azure_sdk_integration"] is True
     assert ctx["azure_monitor_hooks"] is True
+    assert ctx["streaming_support"] is True
     assert ctx["framework"] == "microsoft_agent_framework"
@@ -0,0 +1,41 @@
+"""Unit tests for the runtime adapters' autoscaling context."""
+
+import pytest
+
+from azure_agent_starter_pack.adapters.runtime.aks import AksAdapter
+from azure_agent_starter_pack.adapters.runtime.app_service import AppServiceAdapter
+from azure_agent_starter_pack.adapters.runtime.container_apps import ContainerAppsAdapter
+
+
+@pytest.mark.parametrize("adapter", [AksAdapter(), ContainerAppsAdapter(), AppServiceAdapter()])
+def test_context_bounds_replicas(adapter) -> None:
+    ctx = adapter.get_context()
+    assert 1 <= ctx["min_replicas"] < ctx["max_replicas"]
+
+
+def test_aks_scales_on_requests_with_keda() -> None:
+    ctx = AksAdapter().get_context()
+    assert ctx["keda"] is True
+    assert ctx["concurrent_requests_per_replica"] > 0
+
+
+def test_container_apps_scales_on_http_concurrency() -> None:
+    assert ContainerAppsAdapter().get_context()["concurrent_requests_per_replica"] > 0
+
+
+def test_app_service_autoscales_on_http_queue() -> None:
+    ctx = AppServiceAdapter().get_context()
+    assert ctx["autoscale"] is True
+    assert ctx["http_queue_length_per_instance"] > 0
+
+
+def test_container_apps_keeps_a_warm_pool() -> None:
+    ctx = ContainerAppsAdapter().get_context()
+    assert ctx["min_replicas"] >= 1
+    assert ctx["warmup_path"] == "/ready"
+
+
+def test_app_service_stays_loaded_and_warms_instances() -> None:
+    ctx = AppServiceAdapter().get_context()
+    assert ctx["always_on"] is True
+    assert ctx["warmup_path"] == "/ready"